@@ -7,10 +7,11 @@ a CompositeValidator, and an EventProcessor.
 import asyncio
 from dataclasses import asdict
 import logging
+import re
 from pathlib import Path
 
 from path_event_to_task.path_observer import PathObserver
-from path_event_to_task.asynchronous.event_handler import AsyncEventHandler
+from path_event_to_task.asynchronous.event_handler import AsyncEventHandler, EventBuffer
 from path_event_to_task.asynchronous.processor import EventProcessor
 from path_event_to_task.asynchronous.validator import (
     FileValidator,
@@ -23,30 +24,24 @@ PATH_TO_MONITOR = Path("./input")
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG)
 
-input_buffer = asyncio.Queue()
-async def consume_input_buffer(input_buffer):
+async def do_work(work_to_do):
     """
-    Continuously check the input_buffer, and whenever a path is available,
-    load it into the output_buffer using load_dir_to_buffer.
+    Handle a validated path directly; invoked by the EventProcessor for
+    each item, with no intermediate queue.
     """
-    while True:
-        if input_buffer.qsize() > 0:
-            work_to_do = await input_buffer.get()
-            logger.debug(f"Doing some work with {work_to_do}")
-            input_buffer.task_done()
-
-        else:
-            await asyncio.sleep(0.1)
+    logger.debug("Doing some work with %s", work_to_do)
 
 
 async def main():
-    # Create an asyncio Queue for new filesystem events.
-    event_queue = asyncio.Queue()
+    # Create a thread-safe buffer for new filesystem events.
     loop = asyncio.get_running_loop()
+    event_queue = EventBuffer(loop)
+    # Filter at the source: only events matching the whitelist reach the
+    # handler, so non-matching events never pay the cross-thread hop.
     event_handler = AsyncEventHandler(
         loop=loop,
         event_queue=event_queue,
-        regexes=None,
+        regexes=[rf".*{re.escape(WHITELIST)}$"],
         ignore_directories=False,
         case_sensitive=False,
     )
@@ -62,20 +57,18 @@ async def main():
     # FileValidator checks that the filename exactly matches "LastShot.txt".
     file_validator = FileValidator(name_pattern=WHITELIST)
 
-    # Create the event processor that uses our composite validator.
+    # Create the event processor that uses our composite validator and
+    # hands validated paths straight to do_work.
     event_processor = EventProcessor(
         event_queue,
-        buffer=input_buffer,
         validator=file_validator,
         process_delay=0,
+        on_item=do_work,
     )
     events_consumer_task = asyncio.create_task(event_processor.process_events())
-    input_buffer_task = asyncio.create_task(
-        consume_input_buffer(input_buffer)
-    )
 
-    # Wait for the tasks to run indefinitely.
-    await asyncio.gather(events_consumer_task, input_buffer_task)
+    # Wait for the task to run indefinitely.
+    await asyncio.gather(events_consumer_task)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 # async_event_handler.py
+from collections import deque
 from dataclasses import dataclass
 import asyncio
 import logging
+import os
+import time
 from typing import Optional
 from prometheus_client import Counter
 from watchdog.events import (
@@ -13,6 +16,86 @@ from watchdog.events import (
 logger = logging.getLogger(__name__)
 
 
+class EventBuffer:
+    """
+    Thread-safe handoff between the watchdog dispatcher thread and the
+    event loop.
+
+    Producers append to a plain deque (atomic under the GIL) and schedule a
+    cross-thread wakeup only when the consumer is actually waiting, instead
+    of paying a `call_soon_threadsafe` per event. This is the same
+    sync-producer/async-consumer split a `janus.Queue` would provide, without
+    the extra dependency or the per-put loop callback. Exposes the subset of
+    the `asyncio.Queue` interface used by `EventProcessor` (`get`,
+    `get_nowait`, `put_nowait`, `qsize`, `task_done`).
+    """
+
+    # Default bound; an event storm beyond this drops the oldest events
+    # rather than growing memory without limit.
+    default_maxlen = 10_000
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxlen: Optional[int] = default_maxlen):
+        self._loop = loop
+        self._deque = deque(maxlen=maxlen)
+        self._waiter: Optional[asyncio.Future] = None
+        self._last_drop_warning = 0.0
+
+    def put_threadsafe(self, item):
+        """Append an item from any thread, waking the consumer if it is waiting."""
+        dq = self._deque
+        if dq.maxlen is not None and len(dq) == dq.maxlen:
+            # deque(maxlen=...) silently evicts from the head on append;
+            # surface that, rate-limited to once a second.
+            now = time.monotonic()
+            if now - self._last_drop_warning >= 1.0:
+                self._last_drop_warning = now
+                logger.warning(
+                    "EventBuffer full (%d events); dropping oldest events.",
+                    dq.maxlen,
+                )
+        dq.append(item)
+        if self._waiter is not None:
+            self._loop.call_soon_threadsafe(self._wake)
+
+    def put_nowait(self, item):
+        """Alias for `put_threadsafe`, for `asyncio.Queue` interface parity."""
+        self.put_threadsafe(item)
+
+    def _wake(self):
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def get_nowait(self):
+        """Pop the oldest item, raising `asyncio.QueueEmpty` when none is queued."""
+        try:
+            return self._deque.popleft()
+        except IndexError:
+            raise asyncio.QueueEmpty from None
+
+    async def get(self):
+        """Pop the oldest item, waiting for a producer wakeup when empty."""
+        while True:
+            try:
+                return self._deque.popleft()
+            except IndexError:
+                pass
+            self._waiter = self._loop.create_future()
+            try:
+                # Re-check after publishing the waiter to close the race with
+                # a producer that appended before seeing it.
+                if not self._deque:
+                    await self._waiter
+            finally:
+                self._waiter = None
+
+    def qsize(self) -> int:
+        return len(self._deque)
+
+    def task_done(self):
+        """No-op; present for `asyncio.Queue` interface compatibility."""
+
+
 @dataclass
 class AsyncEventHandlerConfig:
     loop: Optional[asyncio.AbstractEventLoop] = None
@@ -25,12 +108,20 @@ class AsyncEventHandlerConfig:
 
 class AsyncEventHandler(LoggingEventHandler, RegexMatchingEventHandler):
 
-    folders_detected = Counter(
+    # Labelled by handler class, not path: per-path labels grow one
+    # Prometheus series per unique file and never stop.
+    events_detected = Counter(
         "path_observer_events_detected",
         "Number of events detected by the path observer event handler",
-        ["path"],
+        ["handler"],
     )
 
+    # Editors emit a created plus several modified events for a single save;
+    # duplicates of the same (event type, path) inside this window are
+    # dropped before they reach the queue.
+    dedupe_ttl = 0.2
+    dedupe_maxsize = 1024
+
     def __init__(
         self,
         loop: asyncio.AbstractEventLoop,
@@ -42,32 +133,76 @@ class AsyncEventHandler(LoggingEventHandler, RegexMatchingEventHandler):
     ):
         # Initialize parent classes
         LoggingEventHandler.__init__(self, logger=logger)
+        # Forward regexes as given: None means watchdog's match-everything
+        # default, while an explicit list is applied as-is.
         RegexMatchingEventHandler.__init__(
             self,
-            regexes=regexes or None,
+            regexes=regexes,
             ignore_regexes=ignore_regexes or [],
             ignore_directories=ignore_directories,
             case_sensitive=case_sensitive,
         )
         self.loop = loop
-        self.event_queue = event_queue or asyncio.Queue()
+        self.event_queue = event_queue if event_queue is not None else EventBuffer(loop)
+        # Bind the enqueue path once: EventBuffer takes events directly from
+        # the watchdog thread, while a plain asyncio.Queue needs the
+        # cross-thread scheduling hop per event.
+        if isinstance(self.event_queue, EventBuffer):
+            self._enqueue = self.event_queue.put_threadsafe
+        else:
+            self._enqueue = lambda event: self.loop.call_soon_threadsafe(
+                self.event_queue.put_nowait, event
+            )
+        # Resolve the labelled child once so the hot path is a bare inc().
+        self._events_metric = self.events_detected.labels(handler=type(self).__name__)
+        # Only touched from the watchdog dispatcher thread, so no lock needed.
+        self._seen: dict = {}
+
+    def _is_duplicate(self, event: FileSystemEvent) -> bool:
+        """Return True if an identical event was seen within `dedupe_ttl`."""
+        key = (type(event).__name__, event.src_path)
+        now = time.monotonic()
+        seen = self._seen
+        last = seen.get(key)
+        if last is not None and now - last < self.dedupe_ttl:
+            return True
+        if len(seen) >= self.dedupe_maxsize:
+            cutoff = now - self.dedupe_ttl
+            for stale in [k for k, ts in seen.items() if ts < cutoff]:
+                del seen[stale]
+            if len(seen) >= self.dedupe_maxsize:
+                seen.clear()
+        seen[key] = now
+        return False
 
     def on_created(self, event: FileSystemEvent):
         """
         Enqueue the event for async processing.
         """
+        if self._is_duplicate(event):
+            return
+        # Stat here on the watchdog thread while the dentry is warm, so the
+        # validator can reuse the result instead of re-issuing the syscall.
+        try:
+            event._stat = os.stat(event.src_path)
+        except OSError:
+            event._stat = None
         logger.debug(
-            f"on_created triggered for {event.src_path}. Queueing for async processing."
+            "on_created triggered for %s. Queueing for async processing.",
+            event.src_path,
         )
-        # Post to the event loop from the Watchdog thread
-        self.loop.call_soon_threadsafe(self.event_queue.put_nowait, event)
+        self._events_metric.inc()
+        self._enqueue(event)
 
     def on_modified(self, event: FileSystemEvent):
         """
         If you want to handle modifications asynchronously, you can do so similarly.
         """
+        if self._is_duplicate(event):
+            return
         logger.debug(
-            f"on_created triggered for {event.src_path}. Queueing for async processing."
+            "on_modified triggered for %s. Queueing for async processing.",
+            event.src_path,
         )
-        # Post to the event loop from the Watchdog thread
-        self.loop.call_soon_threadsafe(self.event_queue.put_nowait, event)
+        self._events_metric.inc()
+        self._enqueue(event)
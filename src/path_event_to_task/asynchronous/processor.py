@@ -2,7 +2,7 @@
 import asyncio
 from dataclasses import dataclass
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 from path_event_to_task.asynchronous.validator import BaseValidator
 logger = logging.getLogger(__name__)
@@ -14,65 +14,130 @@ class EventProcessorConfig:
     buffer: Optional[asyncio.Queue] = None
     validator: Optional[BaseValidator] = None
     process_delay: Optional[float] = 0
+    on_item: Optional[Callable] = None
 
 class EventProcessor:
 
+    # Maximum number of queued events drained per scheduling of the
+    # processor task.
+    max_batch_size = 64
+
     def __init__(
         self,
         event_queue: asyncio.Queue,
         buffer: asyncio.Queue = None,
         validator=None,
         process_delay: float = 0,
+        on_item: Optional[Callable] = None,
     ):
         """
         Args:
             event_queue (asyncio.Queue): Queue from which filesystem events are read.
             buffer: Target buffer where validated paths are added.
             validator: A single validator instance. This object must have a synchronous
-                       validate(path_input) method that returns (bool, dict).
+                       validate(path_input, stat_result=None) method that returns
+                       (bool, dict); stat_result is an optional pre-fetched os.stat
+                       result reused instead of issuing the syscall again.
             process_delay (float): Optional delay (in seconds) before processing an event.
+            on_item: Optional callback (sync or async) invoked with each validated
+                     path directly, bypassing the buffer hop entirely.
         """
         self.event_queue = event_queue
         self.buffer = buffer
         self.validator = validator
+        self.on_item = on_item
+        # Resolve sync-vs-async once, not per item.
+        self._on_item_is_coro = (
+            asyncio.iscoroutinefunction(on_item) if on_item is not None else False
+        )
+        # Prefer the thread-offloaded validate when the validator provides
+        # one, so slow stat paths never block the event loop.
+        self._validate_async = getattr(validator, "validate_async", None)
         self.process_delay = process_delay
 
     async def process_events(self):
         """
         Continuously processes events by:
-          1. Dequeuing an event.
-          2. Validating its source path using the provided validator.
+          1. Dequeuing an event, then draining any siblings already queued
+             (up to `max_batch_size`) without yielding to the loop.
+          2. Validating each source path using the provided validator.
           3. If validation passes, optionally waiting a delay and adding the path
              (or an alternate value provided via extra info) to the buffer.
         """
         while True:
-            event = await self.event_queue.get()
-            logger.debug(f"EventProcessor: Processing event for {event.src_path}")
+            # Block for the first event, then drain whatever else is queued
+            # so scheduling overhead is amortized over the whole batch.
+            batch = [await self.event_queue.get()]
+            try:
+                while len(batch) < self.max_batch_size:
+                    batch.append(self.event_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
 
-            if self.validator:
-                valid, info = self.validator.validate(event.src_path)
-                if not valid:
-                    logger.debug(
-                        f"EventProcessor: Validation failed for {event.src_path} with error: {info.get('error', 'unknown error')}"
-                    )
+            for event in batch:
+                try:
+                    await self._process_event(event)
+                finally:
                     self.event_queue.task_done()
-                    continue
+
+    async def _process_event(self, event):
+        """Validate a single event and add its path to the buffer."""
+        # With no downstream consumer and no validator there is no observable
+        # effect; skip before paying for any validation syscalls.
+        if self.buffer is None and self.on_item is None and self.validator is None:
+            return
+
+        logger.debug("EventProcessor: Processing event for %s", event.src_path)
+
+        if self.validator:
+            # Reuse a stat captured on the watchdog thread when available;
+            # with the syscall already paid there is nothing slow left to
+            # offload, so the synchronous path is taken directly.
+            stat_result = getattr(event, "_stat", None)
+            if stat_result is not None or self._validate_async is None:
+                valid, info = self.validator.validate(event.src_path, stat_result)
             else:
-                info = {}
+                valid, info = await self._validate_async(event.src_path)
+            if not valid:
+                # Guarded so the info.get lookup is skipped when DEBUG is off.
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "EventProcessor: Validation failed for %s with error: %s",
+                        event.src_path,
+                        info.get("error", "unknown error"),
+                    )
+                return
+        else:
+            info = {}
+
+        if self.process_delay:
+            await asyncio.sleep(self.process_delay)
+
+        # Use an alternate path if provided by the validator; otherwise, use event.src_path.
+        folder_name = str(info.get("new_folder", event.src_path))
 
-            if self.process_delay:
-                await asyncio.sleep(self.process_delay)
+        if self.on_item is not None:
+            # Fused pipeline: hand the item straight to the consumer without
+            # an intermediate queue put/get/wakeup.
+            logger.info("EventProcessor: Consuming item '%s'.", folder_name)
+            try:
+                if self._on_item_is_coro:
+                    await self.on_item(folder_name)
+                else:
+                    self.on_item(folder_name)
+            except Exception as e:
+                logger.exception("Error while consuming item: %s", e)
+            return
 
-            if self.buffer is None:
-                logger.debug(
-                    f"EventProcessor: Skipping buffer addition for {event.src_path}."
-                )
-                self.event_queue.task_done()
-                continue
-            # Use an alternate path if provided by the validator; otherwise, use event.src_path.
-            folder_name = info.get("new_folder", event.src_path)
-            logger.info(
-                f"EventProcessor: Adding folder '{folder_name}' for further processing."
+        if self.buffer is None:
+            logger.debug(
+                "EventProcessor: Skipping buffer addition for %s.", event.src_path
             )
-            await self.buffer.put(str(folder_name))
-            self.event_queue.task_done()
+            return
+        logger.info(
+            "EventProcessor: Adding folder '%s' for further processing.", folder_name
+        )
+        try:
+            self.buffer.put_nowait(folder_name)
+        except asyncio.QueueFull:
+            await self.buffer.put(folder_name)
@@ -1,11 +1,21 @@
 from __future__ import annotations
 from dataclasses import dataclass
+import asyncio
+import functools
+import os
 import re
-from pathlib import Path
+import stat as stat_module
 from datetime import datetime
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile and cache a name pattern so validators recreated with the
+    same configuration share one compiled regex."""
+    return re.compile(pattern)
+
+
 @dataclass
 class BaseValidatorConfig:
     name_pattern: Optional[str] = None
@@ -15,6 +25,15 @@ class BaseValidatorConfig:
     modified_date_max: Optional[datetime] = None
 
 class BaseValidator:
+
+    # Relative cost class used by CompositeValidator to order validators
+    # cheapest-first. Metadata-only checks are cheap; anything that hits
+    # the filesystem should declare a higher cost.
+    cost = 10
+
+    # Bound once at class level to skip the module attribute lookup per event.
+    _from_timestamp = staticmethod(datetime.fromtimestamp)
+
     def __init__(
         self,
         name_pattern: str = None,
@@ -23,52 +42,78 @@ class BaseValidator:
         modified_date_min: datetime = None,
         modified_date_max: datetime = None,
     ):
-        self.name_pattern = re.compile(name_pattern) if name_pattern else None
+        self.name_pattern = _compile_pattern(name_pattern) if name_pattern else None
+        # Pre-bound search method avoids an attribute lookup per validation.
+        self._search = self.name_pattern.search if self.name_pattern else None
         self.creation_date_min = creation_date_min
         self.creation_date_max = creation_date_max
         self.modified_date_min = modified_date_min
         self.modified_date_max = modified_date_max
+        # Pre-resolved POSIX timestamps let the hot path compare floats
+        # straight against the stat result, with no datetime objects.
+        self._creation_min_ts = creation_date_min.timestamp() if creation_date_min else None
+        self._creation_max_ts = creation_date_max.timestamp() if creation_date_max else None
+        self._modified_min_ts = modified_date_min.timestamp() if modified_date_min else None
+        self._modified_max_ts = modified_date_max.timestamp() if modified_date_max else None
 
-    def get_creation_time(self, path: Path) -> datetime:
-        stat_result = path.stat()
+    async def validate_async(self, path_input, stat_result=None) -> (bool, dict):
+        """
+        Run `validate` in the default executor so stat calls on slow
+        filesystems (e.g. NFS) do not block the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.validate, path_input, stat_result)
+
+    @classmethod
+    def _creation_time(cls, stat_result: os.stat_result) -> datetime:
         # Use st_birthtime if available; otherwise, fallback to st_ctime.
         creation_timestamp = getattr(stat_result, "st_birthtime", stat_result.st_ctime)
-        return datetime.fromtimestamp(creation_timestamp)
+        return cls._from_timestamp(creation_timestamp)
 
-    def validate_common(self, path: Path) -> (bool, dict):
-        info = {}
+    def validate_common(self, name: str, stat_result: os.stat_result) -> (bool, dict):
+        """
+        Validate name and date attributes against an already-fetched stat
+        result, so callers pay for a single stat syscall per path.
+        """
+        info = {"name": name}
 
         # Validate name pattern
         if self.name_pattern:
-            if not self.name_pattern.search(path.name):
+            if not self._search(name):
                 return False, {
-                    "error": f"Name '{path.name}' does not match pattern '{self.name_pattern.pattern}'."
+                    "error": f"Name '{name}' does not match pattern '{self.name_pattern.pattern}'."
                 }
             info["name_valid"] = True
 
-        # Validate creation date.
-        creation_time = self.get_creation_time(path)
-        info["creation_time"] = creation_time
-        if self.creation_date_min and creation_time < self.creation_date_min:
-            return False, {
-                "error": f"Creation time {creation_time} is before minimum allowed {self.creation_date_min}."
-            }
-        if self.creation_date_max and creation_time > self.creation_date_max:
-            return False, {
-                "error": f"Creation time {creation_time} is after maximum allowed {self.creation_date_max}."
-            }
+        # Validate creation date. Bounds are compared as raw timestamps;
+        # datetime objects are only built for the info dict and error
+        # messages once a bound is configured.
+        if self._creation_min_ts is not None or self._creation_max_ts is not None:
+            creation_ts = getattr(
+                stat_result, "st_birthtime", stat_result.st_ctime
+            )
+            if self._creation_min_ts is not None and creation_ts < self._creation_min_ts:
+                return False, {
+                    "error": f"Creation time {self._from_timestamp(creation_ts)} is before minimum allowed {self.creation_date_min}."
+                }
+            if self._creation_max_ts is not None and creation_ts > self._creation_max_ts:
+                return False, {
+                    "error": f"Creation time {self._from_timestamp(creation_ts)} is after maximum allowed {self.creation_date_max}."
+                }
+            info["creation_time"] = self._from_timestamp(creation_ts)
 
         # Validate modified date.
-        modified_time = datetime.fromtimestamp(path.stat().st_mtime)
-        info["modified_time"] = modified_time
-        if self.modified_date_min and modified_time < self.modified_date_min:
-            return False, {
-                "error": f"Modified time {modified_time} is before minimum allowed {self.modified_date_min}."
-            }
-        if self.modified_date_max and modified_time > self.modified_date_max:
-            return False, {
-                "error": f"Modified time {modified_time} is after maximum allowed {self.modified_date_max}."
-            }
+        if self._modified_min_ts is not None or self._modified_max_ts is not None:
+            modified_ts = stat_result.st_mtime
+            if self._modified_min_ts is not None and modified_ts < self._modified_min_ts:
+                return False, {
+                    "error": f"Modified time {self._from_timestamp(modified_ts)} is before minimum allowed {self.modified_date_min}."
+                }
+            if self._modified_max_ts is not None and modified_ts > self._modified_max_ts:
+                return False, {
+                    "error": f"Modified time {self._from_timestamp(modified_ts)} is after maximum allowed {self.modified_date_max}."
+                }
+            info["modified_time"] = self._from_timestamp(modified_ts)
 
         return True, info
 
@@ -80,6 +125,10 @@ class FileValidatorConfig(BaseValidatorConfig):
 
 
 class FileValidator(BaseValidator):
+
+    # validate() pays a stat syscall per path.
+    cost = 100
+
     def __init__(
         self,
         name_pattern: str = None,
@@ -105,8 +154,50 @@ class FileValidator(BaseValidator):
         )
         self.filesize_min = filesize_min
         self.filesize_max = filesize_max
+        # The common configuration sets only a name pattern; specialize
+        # validate for it so the hot path skips every unset-bound branch.
+        if self.name_pattern is not None and not any(
+            (
+                filesize_min,
+                filesize_max,
+                creation_date_min,
+                creation_date_max,
+                modified_date_min,
+                modified_date_max,
+            )
+        ):
+            self.validate = self._make_name_only_validate()
+
+    def _make_name_only_validate(self):
+        """
+        Build a specialized validate for the name-pattern-only configuration:
+        one stat, one type check, one regex search, no bound branches.
+        """
+        search = self._search
+        pattern = self.name_pattern.pattern
+        _fspath = os.fspath
+        _stat = os.stat
+        _basename = os.path.basename
+        _isreg = stat_module.S_ISREG
+
+        def validate(path_input, stat_result=None):
+            path = _fspath(path_input)
+            try:
+                st = stat_result if stat_result is not None else _stat(path)
+            except OSError:
+                return False, {"error": f"Path '{path}' does not exist."}
+            if not _isreg(st.st_mode):
+                return False, {"error": f"Path '{path}' is not a file."}
+            name = _basename(path)
+            if not search(name):
+                return False, {
+                    "error": f"Name '{name}' does not match pattern '{pattern}'."
+                }
+            return True, {"name": name, "name_valid": True, "filesize": st.st_size}
+
+        return validate
 
-    def validate(self, path_input) -> (bool, dict):
+    def validate(self, path_input, stat_result=None) -> (bool, dict):
         """
         Validates a file by checking:
           - The path exists and is a file.
@@ -115,26 +206,33 @@ class FileValidator(BaseValidator):
 
         Args:
             path_input (str or Path): The file path to validate.
+            stat_result: Optional pre-fetched os.stat result for the path,
+                reused instead of issuing the syscall again.
 
         Returns:
             tuple: (is_valid: bool, info: dict)
         """
-        path = Path(path_input)
+        # Work on the raw string; pathlib allocation is not worth it on the
+        # per-event hot path.
+        path = os.fspath(path_input)
         info = {}
 
-        if not path.exists():
+        # A single stat covers existence, file-type, size, and date checks.
+        try:
+            st = stat_result if stat_result is not None else os.stat(path)
+        except OSError:
             return False, {"error": f"Path '{path}' does not exist."}
-        if not path.is_file():
+        if not stat_module.S_ISREG(st.st_mode):
             return False, {"error": f"Path '{path}' is not a file."}
 
         # Common validations: name, creation date, and modified date.
-        is_valid, common_info = self.validate_common(path)
+        is_valid, common_info = self.validate_common(os.path.basename(path), st)
         if not is_valid:
             return False, common_info
         info.update(common_info)
 
         # Validate file size.
-        filesize = path.stat().st_size
+        filesize = st.st_size
         info["filesize"] = filesize
         if self.filesize_min is not None and filesize < self.filesize_min:
             return False, {
@@ -152,7 +250,11 @@ class FolderValidatorConfig(BaseValidatorConfig):
     pass
 
 class FolderValidator(BaseValidator):
-    def validate(self, path_input) -> (bool, dict):
+
+    # validate() pays a stat syscall per path.
+    cost = 100
+
+    def validate(self, path_input, stat_result=None) -> (bool, dict):
         """
         Validates a folder by checking:
           - The path exists and is a directory.
@@ -160,20 +262,24 @@ class FolderValidator(BaseValidator):
 
         Args:
             path_input (str or Path): The folder path to validate.
+            stat_result: Optional pre-fetched os.stat result for the path.
 
         Returns:
             tuple: (is_valid: bool, info: dict)
         """
-        path = Path(path_input)
+        path = os.fspath(path_input)
         info = {}
 
-        if not path.exists():
+        # A single stat covers existence, type, and date checks.
+        try:
+            st = stat_result if stat_result is not None else os.stat(path)
+        except OSError:
             return False, {"error": f"Path '{path}' does not exist."}
-        if not path.is_dir():
+        if not stat_module.S_ISDIR(st.st_mode):
             return False, {"error": f"Path '{path}' is not a folder."}
 
         # Common validations: name, creation date, and modified date.
-        is_valid, common_info = self.validate_common(path)
+        is_valid, common_info = self.validate_common(os.path.basename(path), st)
         if not is_valid:
             return False, common_info
         info.update(common_info)
@@ -186,13 +292,19 @@ class CompositeValidator:
         """
         Args:
             validators (list): A list of validator instances. Each must have a
-                validate(path_input) method returning (bool, dict).
+                validate(path_input, stat_result=None) method returning
+                (bool, dict); stat_result is an optional pre-fetched os.stat
+                result the validator may reuse instead of statting again.
         """
-        self.validators = validators
+        # Run cheap validators first so a rejecting metadata check never
+        # pays for a stat-based one. The sort is stable, preserving the
+        # given order within a cost class.
+        self.validators = sorted(validators, key=lambda v: getattr(v, "cost", 50))
 
-    def validate(self, path_input) -> (bool, dict):
+    def validate(self, path_input, stat_result=None) -> (bool, dict):
         """
-        Applies all validators in order on the given path_input.
+        Applies all validators, cheapest cost class first, on the given
+        path_input.
 
         Returns:
             (bool, dict): True and merged extra info if all validators pass,
@@ -200,8 +312,16 @@ class CompositeValidator:
         """
         combined_info = {}
         for validator in self.validators:
-            valid, info = validator.validate(path_input)
+            valid, info = validator.validate(path_input, stat_result)
             if not valid:
                 return False, info
             combined_info.update(info)
         return True, combined_info
+
+    async def validate_async(self, path_input, stat_result=None) -> (bool, dict):
+        """
+        Run the whole validator chain in the default executor, keeping the
+        event loop responsive while validators hit the filesystem.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.validate, path_input, stat_result)
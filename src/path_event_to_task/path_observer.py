@@ -3,7 +3,7 @@ from pathlib import Path
 import threading
 import logging
 
-# from watchdog.observers import Observer
+from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 from watchdog.events import LoggingEventHandler
 from typing import Optional, Union
@@ -15,6 +15,8 @@ class PathObserverConfig:
     path_to_monitor: Union[str, Path]
     recursive: bool = False
     event_handler = None
+    use_polling: bool = False
+    polling_interval: float = 1.0
 
 class PathObserver:
     """
@@ -29,11 +31,22 @@ class PathObserver:
     `on_modified`, or `on_deleted` to implement custom actions when these
     events occur.
 
+    The observer runs on watchdog's own thread rather than as a loop-native
+    inotify/kqueue task: watchdog is the only watcher backend this package
+    supports across Windows, macOS, and Linux, and the thread boundary costs
+    a single consumer wakeup per burst (see
+    `asynchronous.event_handler.EventBuffer`), not a hop per event.
+
     :param path_to_monitor: The path to monitor for file system events.
     :param recursive: Whether to monitor subdirectories. Defaults to False.
     :param event_handler: An optional event handler class derived from
                           `FileSystemEventHandler`. If not provided, a default
                           logging event handler is used.
+    :param use_polling: Force the polling observer instead of the native
+                        OS-event observer (inotify/FSEvents/
+                        ReadDirectoryChangesW). Defaults to False.
+    :param polling_interval: Seconds between directory scans when polling.
+                             Only used when `use_polling` is True.
     """
 
     def __init__(
@@ -41,12 +54,16 @@ class PathObserver:
         path_to_monitor: Union[str, Path],
         recursive: bool = False,
         event_handler=None,
+        use_polling: bool = False,
+        polling_interval: float = 1.0,
     ):
         """
         Initialize the observer for a specific path.
 
         :param path_to_monitor: The path to monitor for file system events.
         :param recursive: Whether to monitor subdirectories.
+        :param use_polling: Force the polling observer instead of the native one.
+        :param polling_interval: Seconds between scans when polling.
         """
         if not isinstance(path_to_monitor, Path):
             path_to_monitor = Path(path_to_monitor)
@@ -57,7 +74,9 @@ class PathObserver:
             if event_handler is None
             else event_handler
         )
-        self.observer = PollingObserver()
+        self.observer = (
+            PollingObserver(timeout=polling_interval) if use_polling else Observer()
+        )
         self._thread: Optional[threading.Thread] = None
 
     def start(self):
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional, Callable, Awaitable, Union
 
 from path_event_to_task.path_observer import PathObserver
-from path_event_to_task.asynchronous.event_handler import AsyncEventHandler
+from path_event_to_task.asynchronous.event_handler import AsyncEventHandler, EventBuffer
 from path_event_to_task.asynchronous.processor import EventProcessor
 from path_event_to_task.asynchronous.validator import (
     BaseValidator, 
@@ -31,8 +31,8 @@ class PathTaskManager:
     Encapsulates:
       - AsyncEventHandler + PathObserver that watch a filesystem path
       - A user-supplied validator (e.g., FileValidator/FolderValidator)
-      - An EventProcessor that takes events from event_queue -> input_buffer
-      - A consumer task for the input_buffer, which may call a user-supplied callback
+      - An EventProcessor that takes events from event_queue and hands each
+        validated path directly to the user-supplied callback
     """
 
     def __init__(
@@ -51,9 +51,8 @@ class PathTaskManager:
         # 1) Create an asyncio loop (if not already in one)
         self.loop = loop or asyncio.new_event_loop()
 
-        # 2) Create the queues
-        self.event_queue = asyncio.Queue()
-        self.task_queue = asyncio.Queue()
+        # 2) Create the event queue
+        self.event_queue = EventBuffer(self.loop)
 
         # 3) Create the async event handler
         self.event_handler = AsyncEventHandler(
@@ -74,12 +73,13 @@ class PathTaskManager:
         # 5) Use the user-supplied validator
         self.validator = validator
 
-        # 6) Create the event processor
+        # 6) Create the event processor, handing validated paths straight to
+        #    the callback instead of through an intermediate queue.
         self.event_processor = EventProcessor(
             event_queue=self.event_queue,
-            buffer=self.task_queue,
             validator=self.validator,
             process_delay=manager_config.process_delay,
+            on_item=consume_callback,
         )
 
         # 7) Store the optional consume callback
@@ -88,42 +88,21 @@ class PathTaskManager:
         # 8) Track any running tasks so we can cancel if needed
         self._tasks = []
 
-    async def _consume_task_queue(self):
-        """
-        Continuously consume task from `self.task_queue`.
-        If `consume_callback` is provided, each task is passed to that callback.
-        """
-        while True:
-            task = await self.task_queue.get()  # blocks until an item is available
-            try:
-                logger.info(f"Consuming task: {task}")
-                # If a callback is provided, call it (sync or async).
-                if self.consume_callback:
-                    if asyncio.iscoroutinefunction(self.consume_callback):
-                        await self.consume_callback(task)
-                    else:
-                        self.consume_callback(task)
-            except Exception as e:
-                logger.exception("Error while consuming input buffer: %s", e)
-            finally:
-                self.task_queue.task_done()
-
     async def run(self):
         """
-        Start the observer in a background thread, create the event-processing tasks,
-        and run them indefinitely (or until canceled).
+        Start the observer in a background thread, create the event-processing task,
+        and run it indefinitely (or until canceled).
         """
         # 1) Start the observer in a background thread
         self.observer.start_in_thread()
         logger.info("Observer started in background thread.")
 
-        # 2) Create and start tasks
+        # 2) Create and start the processor task (which also consumes)
         processor_task = asyncio.create_task(self.event_processor.process_events())
-        consumer_task = asyncio.create_task(self._consume_task_queue())
-        self._tasks.extend([processor_task, consumer_task])
+        self._tasks.append(processor_task)
 
-        # 3) Run them forever (or until exception/cancel)
-        await asyncio.gather(processor_task, consumer_task)
+        # 3) Run it forever (or until exception/cancel)
+        await asyncio.gather(processor_task)
 
     def stop(self):
         """
@@ -1,36 +1,232 @@
+"""
+Synchronous event handlers driven directly by watchdog's dispatcher thread.
+
+For an event-loop-driven pipeline use the `asynchronous` package instead:
+`AsyncEventHandler` posts events across the thread boundary into an
+`EventBuffer` with one wakeup per burst, and `EventProcessor` drains them
+in batches on a single loop. The handlers here stay synchronous by design
+— blocking validation is offloaded to a worker pool so the dispatcher
+thread is never held for `validation_timeout` — and trigger-file checks
+are st_size-only, so there is no read for ring-based async I/O to speed
+up.
+
+The dispatch glue stays pure Python on purpose. Per event it is an
+interned string, a pre-resolved counter child, and two index stores on
+`SPSCRing` — with coalescing amortizing even those across a burst — so a
+compiled extension would save little while making this pure-Python
+package need a build toolchain.
+"""
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from queue import Empty, Full
 import os
-from pathlib import Path
+import re
+import sys
+import threading
 import time
 import logging
 
 from prometheus_client import Counter
 from watchdog.events import (
     RegexMatchingEventHandler,
-    LoggingEventHandler,
+    FileSystemEventHandler,
 )
+from watchdog.observers import Observer
 
 logger = logging.getLogger(__name__)
 
-class BaseEventHandler(RegexMatchingEventHandler, LoggingEventHandler):
+_basename = os.path.basename
 
-    folders_detected = Counter(
-        "path_observer_folders_detected",
-        "Number of folders detected by the path observer",
-        ["path"],
-    )
+
+def _folders_detected_metric() -> Counter:
+    """Create the folders-detected counter, reusing the already-registered
+    collector if this module is imported (or reloaded) more than once."""
+    try:
+        return Counter(
+            "path_observer_folders_detected",
+            "Number of folders detected by the path observer",
+            ["mount"],
+        )
+    except ValueError:
+        from prometheus_client import REGISTRY
+
+        return REGISTRY._names_to_collectors["path_observer_folders_detected"]
+
+
+folders_detected = _folders_detected_metric()
+
+
+@lru_cache(maxsize=1024)
+def _folders_counter(path: str):
+    """Resolve (and cache) the labelled counter child for a path, so the
+    hot event path skips the labels() dict lookup. The label is the
+    path's drive/mount rather than the path itself, keeping series
+    cardinality bounded no matter how many transient folders appear."""
+    return folders_detected.labels(os.path.splitdrive(path)[0] or "/")
+
+
+def _combine_regexes(patterns: list[str], case_sensitive: bool) -> re.Pattern:
+    """Union several patterns into one alternation so dispatch runs a
+    single match instead of looping over K compiled regexes."""
+    combined = "|".join(f"(?:{p})" for p in patterns)
+    return re.compile(combined, 0 if case_sensitive else re.IGNORECASE)
+
+
+class SPSCRing:
+    """
+    Lock-free single-producer/single-consumer ring for the watchdog-thread
+    to processor handoff.
+
+    The producer writes the slot before publishing its head index, and the
+    GIL makes each index store atomic, so one producer and one consumer can
+    share the ring without a mutex. `put`/`get` mirror the queue.Queue
+    methods the handlers already call, raising `queue.Full`/`queue.Empty`.
+
+    `BaseEventHandler` enqueues from several threads (watchdog dispatcher,
+    validator pool, timer flushes) and serializes its puts behind a lock so
+    the ring still sees a single logical producer.
+    """
+
+    __slots__ = ("_buf", "_mask", "_head", "_tail")
+
+    def __init__(self, size: int = 1024):
+        if size <= 0 or size & (size - 1):
+            raise ValueError("size must be a power of two")
+        self._buf = [None] * size
+        self._mask = size - 1
+        self._head = 0  # next write slot; touched only by the producer
+        self._tail = 0  # next read slot; touched only by the consumer
+
+    def put(self, item):
+        head = self._head
+        if head - self._tail > self._mask:
+            raise Full
+        self._buf[head & self._mask] = item
+        self._head = head + 1
+
+    def get(self):
+        tail = self._tail
+        if tail == self._head:
+            raise Empty
+        slot = tail & self._mask
+        item = self._buf[slot]
+        self._buf[slot] = None
+        self._tail = tail + 1
+        return item
+
+    def put_many(self, items) -> int:
+        """Batch fast-path: enqueue as many items as fit with one call,
+        returning how many were enqueued. Never raises `Full`, so callers
+        can account for the dropped remainder themselves."""
+        enqueued = 0
+        for item in items:
+            try:
+                self.put(item)
+            except Full:
+                break
+            enqueued += 1
+        return enqueued
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+
+def _poll_for_nonempty_file(path: str, timeout: float) -> bool:
+    """
+    Fallback: repeatedly stat `path` until it is non-empty or `timeout`
+    seconds elapse. Used when a native watch cannot be established.
+    Like the watch-based wait, this judges emptiness from st_size alone
+    and never opens the file.
+    """
+    # Monotonic integer deadline: immune to wall-clock (NTP) adjustments
+    # and a plain int compare per iteration.
+    deadline = time.monotonic_ns() + int(timeout * 1e9)
+    # Exponential backoff between probes so the poll does not peg a core;
+    # the typical arrival within a few hundred ms costs only tens of stats.
+    delay = 0.01
+    while time.monotonic_ns() < deadline:
+        try:
+            if os.stat(path).st_size > 0:
+                return True
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"A non-critical error occurred {e}, continuing ...")
+        time.sleep(delay)
+        delay = min(0.25, delay * 2)
+    return False
+
+
+def _wait_for_nonempty_file(path: str, timeout: float) -> bool:
+    """
+    Block until `path` exists and is non-empty, for at most `timeout`
+    seconds. A one-shot native watch (inotify/FSEvents/
+    ReadDirectoryChangesW) on the parent directory replaces the stat
+    poll, so the wait burns no CPU until the file actually changes.
+    Non-emptiness is judged from st_size alone; the file contents are
+    never opened or read.
+    """
+    arrived = threading.Event()
+
+    class _TriggerHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.src_path == path or getattr(event, "dest_path", None) == path:
+                arrived.set()
+
+    observer = Observer()
+    try:
+        observer.schedule(_TriggerHandler(), os.path.dirname(path) or ".", recursive=False)
+        observer.start()
+    except OSError as e:
+        logger.warning(f"Could not establish watch for {path} ({e}); polling instead.")
+        return _poll_for_nonempty_file(path, timeout)
+
+    try:
+        deadline = time.monotonic_ns() + int(timeout * 1e9)
+        while True:
+            # Check first: the file may already be there, or the event that
+            # woke us may have completed the write.
+            try:
+                if os.stat(path).st_size > 0:
+                    return True
+            except OSError:
+                pass
+            remaining_ns = deadline - time.monotonic_ns()
+            if remaining_ns <= 0 or not arrived.wait(remaining_ns / 1e9):
+                return False
+            arrived.clear()
+    finally:
+        observer.stop()
+        observer.join()
+
+# RegexMatchingEventHandler only: inheriting LoggingEventHandler as well
+# would run its logger.info override for every dispatched event on top of
+# our own logging, doubling per-event log overhead during bursts.
+class BaseEventHandler(RegexMatchingEventHandler):
+
+    # Kept as a class attribute for callers that reference it here; the
+    # collector itself lives at module scope.
+    folders_detected = folders_detected
+
+    # A path that passed validation is trusted for this long;
+    # LastShot.txt rewrites fire several modified events back to back,
+    # and only the first needs to pay for the trigger-file wait.
+    revalidate_ttl = 1.0
+    revalidate_maxsize = 1024
 
     def __init__(
         self,
-        buffer: deque,
+        buffer: deque | SPSCRing,
         regexes: list[str] | None = None,
         ignore_regexes: list[str] | None = None,
         ignore_directories: bool = False,
         case_sensitive: bool = False,
         validation_enabled: bool = True,
         validation_timeout: int = 2,
+        trigger_filename: str = "ShotLog.json",
+        coalesce_window: float = 0.01,
     ):
-        LoggingEventHandler.__init__(self, logger=logger)
         RegexMatchingEventHandler.__init__(
             self,
             regexes=regexes,
@@ -38,13 +234,147 @@ class BaseEventHandler(RegexMatchingEventHandler, LoggingEventHandler):
             ignore_directories=ignore_directories,
             case_sensitive=case_sensitive,
         )
+        # Replace watchdog's per-pattern match loop with one combined
+        # alternation per list; the default match-everything regex is left
+        # alone when no patterns were given.
+        if regexes:
+            self._regexes = [_combine_regexes(regexes, case_sensitive)]
+        if ignore_regexes:
+            self._ignore_regexes = [_combine_regexes(ignore_regexes, case_sensitive)]
         self.buffer = buffer
         self.validation_enabled = validation_enabled
         self.validation_timeout = validation_timeout
+        self.trigger_filename = trigger_filename
+        # Validated events are held for up to coalesce_window seconds and
+        # flushed as one batch, amortizing buffer, counter, and log
+        # overhead across a burst. Set to 0 to flush per event.
+        self.coalesce_window = coalesce_window
+        self._pending: list[str] = []
+        # Guards _pending/_flush_timer and serializes every buffer put:
+        # enqueues run on the watchdog thread, validator pool threads, and
+        # timer flush threads, so SPSCRing's single-producer contract only
+        # holds if this handler is the one (serialized) producer.
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        # src_path -> monotonic time of last successful validation.
+        self._validated_cache: dict[str, float] = {}
+        self._last_drop_warning = 0.0
+        # Validation may block for up to validation_timeout; running it here
+        # would stall the single watchdog dispatcher thread and back up the
+        # kernel event buffer. Offload it so the dispatcher returns at once.
+        self._validator_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="event-validator"
+        )
 
     def process_event(self, event):
-        """Validate a detected event for addition to the buffer."""
-        pass
+        """
+        Validate a detected event for addition to the buffer.
+
+        With validation enabled the event is validated on the pool and
+        enqueued from the worker thread once it passes, so `buffer.put`
+        must be thread-safe (as `queue.Queue` is).
+        """
+        if self.validation_enabled:
+            # A path validated within revalidate_ttl goes straight to the
+            # buffer; re-running the trigger-file wait for every event of
+            # a burst would only re-stat the same file.
+            last = self._validated_cache.get(event.src_path)
+            if last is not None and time.monotonic() - last < self.revalidate_ttl:
+                self._enqueue_event(event)
+                return
+            future = self._validator_pool.submit(self.validate, event)
+            future.add_done_callback(
+                lambda future, event=event: self._finish_event(event, future)
+            )
+            return
+        self._enqueue_event(event)
+
+    def _finish_event(self, event, future):
+        """Enqueue the event once its offloaded validation has passed."""
+        try:
+            valid = future.result()
+        except Exception:
+            logger.exception(
+                f"Validation raised an unexpected error for {event.src_path}"
+            )
+            return
+        if valid:
+            cache = self._validated_cache
+            if len(cache) >= self.revalidate_maxsize:
+                cutoff = time.monotonic() - self.revalidate_ttl
+                for stale in [p for p, ts in cache.items() if ts < cutoff]:
+                    del cache[stale]
+            cache[event.src_path] = time.monotonic()
+            self._enqueue_event(event)
+
+    def _enqueue_event(self, event):
+        """Put a validated event's path into the buffer and count it."""
+        # Repeated events for the same file (LastShot.txt is rewritten every
+        # shot) arrive as equal-but-distinct strings; interning collapses
+        # them to one object, so downstream comparisons and dict lookups
+        # short-circuit on identity.
+        path = sys.intern(event.src_path)
+        if not self.coalesce_window:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Folder '{_basename(path)}' detected and added to processing queue",
+                    extra={"path": path},
+                )
+            try:
+                with self._pending_lock:
+                    self.buffer.put(path)
+            except Full:
+                self._warn_dropped(1)
+                return
+            _folders_counter(path).inc()
+            return
+        with self._pending_lock:
+            self._pending.append(path)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.coalesce_window, self._flush_pending
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_pending(self):
+        """Flush the coalesced batch: one buffer call, one counter inc per
+        unique path, one log line for the whole window. When the buffer
+        fills mid-batch the remainder is dropped (with a rate-limited
+        warning), matching the async side's drop-on-full policy."""
+        with self._pending_lock:
+            batch = self._pending
+            self._pending = []
+            self._flush_timer = None
+            if not batch:
+                return
+            put_many = getattr(self.buffer, "put_many", None)
+            if put_many is not None:
+                enqueued = put_many(batch)
+            else:
+                enqueued = 0
+                for path in batch:
+                    try:
+                        self.buffer.put(path)
+                    except Full:
+                        break
+                    enqueued += 1
+        if enqueued < len(batch):
+            self._warn_dropped(len(batch) - enqueued)
+        counts: dict[str, int] = {}
+        for path in batch[:enqueued]:
+            counts[path] = counts.get(path, 0) + 1
+        for path, n in counts.items():
+            _folders_counter(path).inc(n)
+        logger.debug("Flushed %d coalesced event(s) to the processing queue", enqueued)
+
+    def _warn_dropped(self, count: int):
+        """Warn that events were dropped on a full buffer, at most once a
+        second, mirroring EventBuffer's drop warning on the async side."""
+        now = time.monotonic()
+        if now - self._last_drop_warning >= 1.0:
+            self._last_drop_warning = now
+            logger.warning("Event buffer full; dropped %d event(s).", count)
 
     def on_created(self, event):
         """Event handler for when a file or directory is created."""
@@ -56,10 +386,33 @@ class BaseEventHandler(RegexMatchingEventHandler, LoggingEventHandler):
 
     def validate(self, event, timeout=None):
         # Ensure that event is a directory
-        # Ensure that ShotLog.json file is in directory
-        # Ensure that ShotLog.json file is not empty
+        # Ensure that the trigger file is in the directory
+        # Ensure that the trigger file is not empty
+
+        timeout = timeout or self.validation_timeout
+
+        # Ensure that event is a directory
+        if not event.is_directory:
+            logger.error(f"Detected event is not a directory, and is not suitable for ingest. Only directories are supported at this time")
+            return False
+
+        # Ensure that directory exists. Plain os.path avoids constructing a
+        # Path object (and its parsing) per event just to issue one stat.
+        if not os.path.exists(event.src_path):
+            logger.error(f"Detected event does not exist")
+            return False
 
-        return True
+        # Ensure that a non-empty trigger file is in the directory,
+        # waiting on a native filesystem watch rather than polling.
+        trigger = os.path.join(event.src_path, self.trigger_filename)
+        if _wait_for_nonempty_file(trigger, timeout):
+            return True
+        else:
+            logger.error(
+                f"Directory {event.src_path} detected, however a non-empty {self.trigger_filename} not found within timeout of {timeout}s. Ensure that {self.trigger_filename} is present and not empty.",
+                extra={"event": event},
+            )
+            return False
 
 
 class TestDataEventHandler(BaseEventHandler):
@@ -84,70 +437,10 @@ class TestDataEventHandler(BaseEventHandler):
             validation_timeout=validation_timeout,
         )
 
-    def process_event(self, event):
-        """Validate a detected event for addition to the buffer."""
-        folder_name = os.path.basename(event.src_path)
-        logger.debug(
-            f"Folder '{folder_name}' detected for ingest.",
-            extra={"path": event.src_path},
-        )
-        # If validation is enabled, validate the event
-        if self.validation_enabled:
-            if not self.validate(event):
-                # If validation fails, return None
-                return
-
-        # Put the path in the buffer
-        logger.debug(
-            f"Folder '{folder_name}' added to processing queue",
-            extra={"path": event.src_path},
-        )
-        self.buffer.put(event.src_path)
-        self.folders_detected.labels(event.src_path).inc()
-
     def on_created(self, event):
         """Event handler for when a file or directory is created."""
         self.process_event(event)
 
-    def validate(self, event, timeout=None):
-        # Ensure that event is a directory
-        # Ensure that ShotLog.json file is in directory
-        # Ensure that ShotLog.json file is not empty
-
-        timeout = timeout or self.validation_timeout
-        start_time = time.time()
-
-        # Ensure that event is a directory
-        if not event.is_directory:
-            logger.error(f"Detected event is not a directory, and is not suitable for ingest. Only directories are supported at this time")
-            return False
-
-        # Ensure that directory exists
-        if not Path(event.src_path).exists():
-            logger.error(f"Detected event does not exist")
-            return False
-
-        # Ensure that ShotLog.json file is in directory
-        while time.time() - start_time < timeout:
-            for file in os.listdir(event.src_path):
-                if file == "ShotLog.json":
-                    try:
-                        with open(os.path.join(event.src_path, file), "r") as f:
-                            if f.read():
-                                return True
-                    except OSError as e:
-                        logger.error(f"A non-critical error occurred {e}, continuing ...")
-                        continue
-
-                else:
-                    continue
-        else:
-            logger.error(
-                f"Directory {event.src_path} detected, however a non-empty ShotLog.json not found within timeout of {timeout}s. Ensure that ShotLog.json is present and not empty.",
-                extra={"event": event},
-            )
-            return False
-
 
 class LastShotEventHandler(BaseEventHandler):
 
@@ -170,29 +463,8 @@ class LastShotEventHandler(BaseEventHandler):
             case_sensitive=case_sensitive,
             validation_enabled=validation_enabled,
             validation_timeout=validation_timeout,
+            trigger_filename=trigger_filename,
         )
-        self.trigger_filename = trigger_filename    
-
-    def process_event(self, event):
-        """Validate a detected event for addition to the buffer."""
-        folder_name = os.path.basename(event.src_path)
-        logger.debug(
-            f"Folder '{folder_name}' detected for ingest.",
-            extra={"path": event.src_path},
-        )
-        # If validation is enabled, validate the event
-        if self.validation_enabled:
-            if not self.validate(event):
-                # If validation fails, return None
-                return
-
-        # Put the path in the buffer
-        logger.debug(
-            f"Folder '{folder_name}' added to processing queue",
-            extra={"path": event.src_path},
-        )
-        self.buffer.put(event.src_path)
-        self.folders_detected.labels(event.src_path).inc()
 
     def on_created(self, event):
         """Event handler for when a file or directory is created."""
@@ -200,48 +472,4 @@ class LastShotEventHandler(BaseEventHandler):
 
     def on_modified(self, event):
         """Event handler for when a file or directory is modified."""
-        # self.process_event(event)
         self.process_event(event)
-
-    def validate(self, event, timeout=None):
-        # Ensure that event is a directory
-        # Ensure that ShotLog.json file is in directory
-        # Ensure that ShotLog.json file is not empty
-
-        timeout = timeout or self.validation_timeout
-        start_time = time.time()
-
-        # Ensure that event is a directory
-        if not event.is_directory:
-            logger.error(
-                f"Detected event is not a directory, and is not suitable for ingest. Only directories are supported at this time"
-            )
-            return False
-
-        # Ensure that directory exists
-        if not Path(event.src_path).exists():
-            logger.error(f"Detected event does not exist")
-            return False
-
-        # Ensure that ShotLog.json file is in directory
-        while time.time() - start_time < timeout:
-            for file in os.listdir(event.src_path):
-                if file == "ShotLog.json":
-                    try:
-                        with open(os.path.join(event.src_path, file), "r") as f:
-                            if f.read():
-                                return True
-                    except OSError as e:
-                        logger.error(
-                            f"A non-critical error occurred {e}, continuing ..."
-                        )
-                        continue
-
-                else:
-                    continue
-        else:
-            logger.error(
-                f"Directory {event.src_path} detected, however a non-empty ShotLog.json not found within timeout of {timeout}s. Ensure that ShotLog.json is present and not empty.",
-                extra={"event": event},
-            )
-            return False
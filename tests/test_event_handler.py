@@ -1,7 +1,48 @@
 
+from queue import Empty, Full
 import time
+
+import pytest
 from watchdog.observers import Observer
-from path_event_to_task.synchronous.event_handler import TestDataEventHandler, LastShotEventHandler
+from path_event_to_task.synchronous.event_handler import (
+    SPSCRing,
+    TestDataEventHandler,
+    LastShotEventHandler,
+)
+
+
+def test_spsc_ring_fifo_and_signals():
+    """put/get preserve FIFO order and signal Full/Empty like queue.Queue."""
+    ring = SPSCRing(size=4)
+    with pytest.raises(Empty):
+        ring.get()
+    for i in range(4):
+        ring.put(i)
+    with pytest.raises(Full):
+        ring.put(99)
+    assert [ring.get() for _ in range(4)] == [0, 1, 2, 3]
+
+
+def test_spsc_ring_wraparound():
+    """Indices keep growing past size; slots must wrap onto the buffer."""
+    ring = SPSCRing(size=4)
+    for i in range(10):
+        ring.put(i)
+        assert ring.get() == i
+    assert len(ring) == 0
+
+
+def test_spsc_ring_put_many_partial():
+    """put_many enqueues what fits and reports the count, never raising."""
+    ring = SPSCRing(size=4)
+    ring.put("x")
+    assert ring.put_many(["a", "b", "c", "d"]) == 3
+    assert [ring.get() for _ in range(4)] == ["x", "a", "b", "c"]
+
+
+def test_spsc_ring_rejects_non_power_of_two_size():
+    with pytest.raises(ValueError):
+        SPSCRing(size=3)
 
 
 # @pytest.fixture
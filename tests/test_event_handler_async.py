@@ -1,4 +1,61 @@
 import asyncio
+import logging
+import threading
+
+import pytest
+
+from path_event_to_task.asynchronous.event_handler import EventBuffer
+
+
+async def test_event_buffer_get_returns_queued_item():
+    """A queued item is returned without blocking."""
+    buffer = EventBuffer(asyncio.get_running_loop())
+    buffer.put_threadsafe("item")
+    assert await buffer.get() == "item"
+    assert buffer.qsize() == 0
+
+
+async def test_event_buffer_get_nowait_empty():
+    """get_nowait raises QueueEmpty when nothing is queued."""
+    buffer = EventBuffer(asyncio.get_running_loop())
+    with pytest.raises(asyncio.QueueEmpty):
+        buffer.get_nowait()
+
+
+async def test_event_buffer_producer_thread_wakes_blocked_get():
+    """A put from another thread wakes a consumer already waiting."""
+    buffer = EventBuffer(asyncio.get_running_loop())
+    consumer = asyncio.ensure_future(buffer.get())
+    # Let the consumer block on its waiter before producing.
+    await asyncio.sleep(0.05)
+    producer = threading.Thread(target=buffer.put_threadsafe, args=("item",))
+    producer.start()
+    assert await asyncio.wait_for(consumer, timeout=2) == "item"
+    producer.join()
+
+
+async def test_event_buffer_item_queued_before_waiter_is_seen():
+    """get() re-checks the deque after publishing its waiter, so an item
+    appended without a wakeup (the producer raced ahead of the waiter)
+    is still consumed."""
+    buffer = EventBuffer(asyncio.get_running_loop())
+    # Append directly, as a producer that saw no waiter would.
+    buffer._deque.append("raced")
+    assert await asyncio.wait_for(buffer.get(), timeout=2) == "raced"
+
+
+async def test_event_buffer_drops_oldest_at_maxlen(caplog):
+    """At maxlen the oldest event is evicted and a warning is logged."""
+    buffer = EventBuffer(asyncio.get_running_loop(), maxlen=2)
+    with caplog.at_level(logging.WARNING):
+        buffer.put_threadsafe("a")
+        buffer.put_threadsafe("b")
+        buffer.put_threadsafe("c")
+    assert buffer.qsize() == 2
+    assert buffer.get_nowait() == "b"
+    assert buffer.get_nowait() == "c"
+    assert any("dropping oldest" in r.getMessage() for r in caplog.records)
+
 
 # from path_observer.asynchronous.event_handler import AsyncTestDataEventHandler
 # from path_observer.asynchronous.processor import process_incoming_events
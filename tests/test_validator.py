@@ -103,7 +103,17 @@ def test_valid_folder(tmp_path):
     validator = FolderValidator(name_pattern=r"data")
     valid, info = validator.validate(folder_path)
     assert valid is True
-    # The info dict should include creation_time and modified_time.
+    # Date fields are only computed (and reported) when date bounds are set.
+    assert "creation_time" not in info
+    assert "modified_time" not in info
+
+    bounded = FolderValidator(
+        name_pattern=r"data",
+        creation_date_min=datetime.now() - timedelta(days=1),
+        modified_date_min=datetime.now() - timedelta(days=1),
+    )
+    valid, info = bounded.validate(folder_path)
+    assert valid is True
     assert "creation_time" in info
     assert "modified_time" in info
 